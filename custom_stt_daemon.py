@@ -7,6 +7,9 @@ from typing import Optional
 from dotenv import load_dotenv
 import azure.cognitiveservices.speech as speechsdk
 
+# add_domain_terms is re-exported for runtime additions to the shared corrector
+from term_corrector import TermCorrector, add_domain_terms, correct_text, load_shared_corrector  # noqa: F401
+
 load_dotenv()
 
 # BASE STT DAEMON
@@ -49,6 +52,21 @@ PHRASE_LIST = [
     "Help me troubleshoot my CSI Interfusion integration issue",
 ]
 
+# Post-recognition correction of domain-term near-misses ("Omni Connect" -> "OmniConnect")
+TERM_CORRECTION = os.getenv("TERM_CORRECTION", "true").lower() == "true"
+CORRECTION_CORPUS_FILES = os.getenv(
+    "CORRECTION_CORPUS_FILES",
+    "./CSI_Interfusion_STT_training_dataset_150.txt,./custom_dataset/training/trans.txt",
+)
+
+def get_term_corrector() -> Optional[TermCorrector]:
+    """Shared across mic/file sessions; None when TERM_CORRECTION is off."""
+    if not TERM_CORRECTION:
+        return None
+
+    corpus = [Path(f.strip()) for f in CORRECTION_CORPUS_FILES.split(",") if f.strip()]
+    return load_shared_corrector(PHRASE_LIST, corpus)
+
 def build_speech_config() -> speechsdk.SpeechConfig:
     if not CUSTOM_ENDPOINT_KEY or not SPEECH_REGION:
         raise RuntimeError("Set CUSTOM_ENDPOINT_KEY and SPEECH_REGION in .env")
@@ -93,6 +111,7 @@ def transcribe_microphone():
     recognizer = speechsdk.SpeechRecognizer(speech_config=cfg, audio_config=audio_input)
 
     attach_phrase_list(recognizer)
+    get_term_corrector()
 
     print(f"[STT] Mic on (locale={LOCALE}) | Strategy={SEG_STRAT} | "
           f"SilenceTimeout=[Init: {SEG_INIT_SILENCE_TIMEOUT}ms, End: {SEG_END_SILENCE_TIMEOUT}ms")
@@ -108,15 +127,15 @@ def transcribe_microphone():
         # final text for the segment that just closed
         
         if evt.result.reason == speechsdk.ResultReason.RecognizedSpeech:
-            print(f"[Segment][Display]   {evt.result.text}")
+            print(f"[Segment][Display]   {correct_text(evt.result.text)}")
 
             try:
                 payload = json.loads(evt.result.json)
                 # payload structure: { "NBest": [ { "Display": "...", "Lexical": "...", "ITN": "...", "MaskedITN": "...", ... } ], ... }
                 best = payload.get("NBest", [{}])[0]
                 #print(f"[Segment][Lexical]   {best.get('Lexical', '')}")
-                #print(f"[Segment][ITN]       {best.get('ITN', '')}")
-                #print(f"[Segment][MaskedITN] {best.get('MaskedITN', '')}")
+                #print(f"[Segment][ITN]       {correct_text(best.get('ITN', ''))}")
+                #print(f"[Segment][MaskedITN] {correct_text(best.get('MaskedITN', ''))}")
                 # Optional: confidence, words with timings, etc., if present:
                 # print(f"[Segment][Confidence] {best.get('Confidence')}")
                 # for w in best.get("Words", []): print(w)
@@ -155,6 +174,7 @@ def transcribe_file(wav_path: Path) -> Optional[str]:
     recognizer = speechsdk.SpeechRecognizer(speech_config=cfg, audio_config=audio_input)
 
     attach_phrase_list(recognizer)
+    get_term_corrector()
     
     print(f"[STT] Transcribing: {wav_path.name} (locale={LOCALE})")
     
@@ -168,15 +188,15 @@ def transcribe_file(wav_path: Path) -> Optional[str]:
         # final text for the segment that just closed
         
         if evt.result.reason == speechsdk.ResultReason.RecognizedSpeech:
-            print(f"[Segment][Display]   {evt.result.text}")
+            print(f"[Segment][Display]   {correct_text(evt.result.text)}")
 
             try:
                 payload = json.loads(evt.result.json)
                 # payload structure: { "NBest": [ { "Display": "...", "Lexical": "...", "ITN": "...", "MaskedITN": "...", ... } ], ... }
                 best = payload.get("NBest", [{}])[0]
                 print(f"[Segment][Lexical]   {best.get('Lexical', '')}")
-                print(f"[Segment][ITN]       {best.get('ITN', '')}")
-                print(f"[Segment][MaskedITN] {best.get('MaskedITN', '')}")
+                print(f"[Segment][ITN]       {correct_text(best.get('ITN', ''))}")
+                print(f"[Segment][MaskedITN] {correct_text(best.get('MaskedITN', ''))}")
                 # Optional: confidence, words with timings, etc., if present:
                 # print(f"[Segment][Confidence] {best.get('Confidence')}")
                 # for w in best.get("Words", []): print(w)
@@ -0,0 +1,288 @@
+import re
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+# Corpus line prefixes like '001_.wav\t' (trans.txt) or '01. ' (phrase files)
+_LINE_PREFIX = re.compile(r"^\s*(?:\S+\.wav\s+|\d+\.?\s+)")
+_SENTENCE_SPLIT = re.compile(r"[.?!;:,]+\s*")
+_TOKEN = re.compile(r"[A-Za-z0-9][A-Za-z0-9’'\-]*")
+_POSSESSIVE = re.compile(r"[’']s$")
+
+# separators that may be dropped inside a term ("Omni Connect", "Omni-Connect", "you’ve");
+# any other punctuation (".", ",", "?", ...) is a hard break a match never crosses
+_SOFT_SEPARATORS = frozenset("-‐’'")
+
+# terms shorter than this (after compaction) are too ambiguous to rewrite
+MIN_TERM_LEN = 5
+
+
+def _fold(ch: str) -> str:
+    # per-character casefold so every key char maps back to one source index
+    return "".join(k for k in ch.casefold() if k.isalnum())
+
+
+def _is_hard_break(ch: str) -> bool:
+    return not (ch.isalnum() or ch.isspace() or ch in _SOFT_SEPARATORS)
+
+
+def compact(text: str) -> str:
+    """Matching key for a phrase: casefolded alphanumerics only, no spaces/punctuation."""
+    return "".join(_fold(ch) for ch in text if ch.isalnum())
+
+
+def _is_proper(term: str) -> bool:
+    # proper nouns ("CSI Interfusion", "OmniConnect") keep their canonical casing
+    return any(ch.isupper() for ch in term[1:])
+
+
+def _is_term_token(tok: str) -> bool:
+    return tok[0].isupper() or tok[0].isdigit()
+
+
+def extract_terms(lines: Iterable[str]) -> List[str]:
+    """
+    Pull domain terms out of free text:
+    - runs of 2+ capitalised/numeric words ("Enterprise Integration Platform", "ISO 27001")
+    - single CamelCase words ("OmniConnect", "NeuroSemantic")
+    Sentence-initial words and possessives ("Interfusion’s") end/skip a run.
+    """
+    terms: Dict[str, str] = {}
+
+    def flush(run: List[str]):
+        if len(run) >= 2 or (run and _is_proper(run[0]) and not run[0].isupper()):
+            term = " ".join(run)
+            if len(compact(term)) >= MIN_TERM_LEN:
+                terms.setdefault(compact(term), term)
+        run.clear()
+
+    for line in lines:
+        line = _LINE_PREFIX.sub("", line).strip()
+        for sentence in _SENTENCE_SPLIT.split(line):
+            run: List[str] = []
+            for i, tok in enumerate(_TOKEN.findall(sentence)):
+                # sentence starts are capitalised regardless; "I" is never a term
+                if (i == 0 and not _is_proper(tok)) or tok == "I" or not _is_term_token(tok):
+                    flush(run)
+                    continue
+                stripped = _POSSESSIVE.sub("", tok)
+                run.append(stripped)
+                if stripped != tok:
+                    flush(run)
+            flush(run)
+
+    return list(terms.values())
+
+
+def mine_terms(paths: Iterable[Path]) -> List[str]:
+    """extract_terms() over corpus files (trans.txt or one phrase per line)."""
+    lines: List[str] = []
+    for path in paths:
+        src = Path(path)
+        if not src.exists():
+            print(f"[Corrector] Corpus file not found, skipping: {src}")
+            continue
+        lines.extend(src.read_text(encoding="utf-8").splitlines())
+    return extract_terms(lines)
+
+
+class _Automaton(NamedTuple):
+    goto: List[Dict[str, int]]
+    fail: List[int]
+    out: List[int]   # term id ending exactly at this node
+    link: List[int]  # nearest proper-suffix node that ends a term
+    terms: List[str]
+    lens: List[int]
+
+
+class TermCorrector:
+    """
+    Aho-Corasick automaton over compacted domain terms.
+
+    Recognised text is compacted the same way (casefolded, whitespace, hyphens and
+    apostrophes dropped) and scanned once, so spacing/case near-misses such as
+    "CSI Inter fusion" or "Omni Connect" land on the same key as the canonical term.
+    Other punctuation resets the automaton, so a match never spans two sentences.
+    Matches must start and end on word boundaries of the original text and are
+    replaced leftmost-longest.
+
+    Terms can be added while the daemon is running. add_term()/add_terms() copy the
+    automaton, insert and relink the copy (O(trie size)) in the adding thread, then
+    swap it in; find()/correct() keep scanning the previous snapshot meanwhile and
+    never wait on a relink. Batch additions through add_terms().
+    """
+
+    def __init__(self, terms: Iterable[str] = ()):
+        self._state = _Automaton([{}], [0], [-1], [-1], [], [])
+        self._lock = threading.Lock()  # serialises writers only
+
+        self.add_terms(terms)
+
+    def __len__(self) -> int:
+        return len(self._state.terms)
+
+    def add_term(self, term: str) -> bool:
+        """
+        Insert a canonical term. Returns False if it is too short, already known, or
+        contains punctuation other than hyphens/apostrophes ("Node.js", "24/7").
+        """
+        return self.add_terms([term]) == 1
+
+    def add_terms(self, terms: Iterable[str]) -> int:
+        """Insert several terms and relink once. Returns how many were new."""
+        terms = list(terms)
+        with self._lock:
+            cur = self._state
+            new = _Automaton(
+                [dict(edges) for edges in cur.goto],
+                list(cur.fail), list(cur.out), list(cur.link),
+                list(cur.terms), list(cur.lens),
+            )
+            added = sum(self._insert(new, t) for t in terms)
+            if added:
+                self._build_links(new)
+                self._state = new
+            return added
+
+    @staticmethod
+    def _insert(a: _Automaton, term: str) -> bool:
+        term = term.strip()
+        key = compact(term)
+        if len(key) < MIN_TERM_LEN or any(_is_hard_break(ch) for ch in term):
+            # find() breaks on "." "/" "+" etc., so such a term could never match itself
+            return False
+
+        node = 0
+        for ch in key:
+            nxt = a.goto[node].get(ch)
+            if nxt is None:
+                nxt = len(a.goto)
+                a.goto[node][ch] = nxt
+                a.goto.append({})
+                a.fail.append(0)
+                a.out.append(-1)
+                a.link.append(-1)
+            node = nxt
+
+        # first registration wins (phrase list before mined terms)
+        if a.out[node] != -1:
+            return False
+        a.out[node] = len(a.terms)
+        a.terms.append(term)
+        a.lens.append(len(key))
+        return True
+
+    @staticmethod
+    def _build_links(a: _Automaton):
+        # full BFS over the trie; new terms can change links of existing nodes too
+        queue: List[int] = []
+        for child in a.goto[0].values():
+            a.fail[child] = 0
+            a.link[child] = -1
+            queue.append(child)
+
+        for node in queue:
+            for ch, child in a.goto[node].items():
+                f = a.fail[node]
+                while f and ch not in a.goto[f]:
+                    f = a.fail[f]
+                f = a.goto[f].get(ch, 0)
+                a.fail[child] = f
+                a.link[child] = f if a.out[f] != -1 else a.link[f]
+                queue.append(child)
+
+    def find(self, text: str) -> List[Tuple[int, int, str]]:
+        """Return non-overlapping (start, end, canonical_term) matches in `text`."""
+        # compacted stream + back-mapping to original offsets; None marks a hard break
+        keys: List[Optional[str]] = []
+        pos: List[int] = []
+        for i, ch in enumerate(text):
+            if ch.isalnum():
+                for k in _fold(ch):
+                    keys.append(k)
+                    pos.append(i)
+            elif _is_hard_break(ch):
+                keys.append(None)
+                pos.append(i)
+
+        n = len(text)
+        goto, fail, out, link, terms, lens = self._state  # one consistent snapshot
+        candidates: List[Tuple[int, int, int]] = []
+        node = 0
+
+        for j, ch in enumerate(keys):
+            if ch is None:
+                node = 0
+                continue
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+
+            # must end on a word boundary, not halfway through a folded char ("ß" -> "ss")
+            end = pos[j] + 1
+            if (end < n and text[end].isalnum()) or (j + 1 < len(pos) and pos[j + 1] == pos[j]):
+                continue
+
+            # longest term ending here whose start is also on a word boundary
+            hit = node if out[node] != -1 else link[node]
+            while hit != -1:
+                tid = out[hit]
+                s = j - lens[tid] + 1
+                start = pos[s]
+                if (start == 0 or not text[start - 1].isalnum()) and (s == 0 or pos[s - 1] != start):
+                    candidates.append((start, end, tid))
+                    break
+                hit = link[hit]
+
+        matches: List[Tuple[int, int, str]] = []
+        last_end = 0
+        for start, end, tid in sorted(candidates, key=lambda c: (c[0], -c[1])):
+            if start >= last_end:
+                matches.append((start, end, terms[tid]))
+                last_end = end
+        return matches
+
+    def correct(self, text: Optional[str]) -> Optional[str]:
+        """Rewrite near-miss spellings of known terms to their canonical form."""
+        if not text:
+            return text
+
+        parts: List[str] = []
+        last = 0
+        for start, end, term in self.find(text):
+            parts.append(text[last:start])
+            parts.append(term)
+            last = end
+        parts.append(text[last:])
+        return "".join(parts)
+
+
+# process-wide corrector shared by the daemon's mic/file sessions
+_shared: Optional[TermCorrector] = None
+_shared_lock = threading.Lock()
+
+
+def load_shared_corrector(phrases: Iterable[str], corpus: Iterable[Path]) -> TermCorrector:
+    """Build the shared corrector on first call; later calls return the same instance."""
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            # only the proper-noun spans of the phrase list, never whole sentences;
+            # added first so their spellings win over mined duplicates
+            corrector = TermCorrector(extract_terms(phrases))
+            corrector.add_terms(mine_terms(corpus))
+            print(f"[Corrector] {len(corrector)} domain terms loaded")
+            _shared = corrector
+        return _shared
+
+
+def add_domain_terms(terms: Iterable[str]) -> int:
+    """Add terms to the running shared corrector; returns how many were new (0 if not loaded)."""
+    corrector = _shared
+    return corrector.add_terms(terms) if corrector else 0
+
+
+def correct_text(text: str) -> str:
+    """Correct with the shared corrector; text passes through unchanged if it is not loaded."""
+    corrector = _shared
+    return corrector.correct(text) if corrector else text
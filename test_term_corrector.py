@@ -0,0 +1,123 @@
+from pathlib import Path
+
+import term_corrector
+from term_corrector import (
+    TermCorrector,
+    add_domain_terms,
+    correct_text,
+    extract_terms,
+    load_shared_corrector,
+    mine_terms,
+)
+
+CORPUS_DIR = Path(__file__).resolve().parent
+
+
+def make_corrector():
+    return TermCorrector(["CSI Interfusion", "OmniConnect", "Enterprise Integration Platform"])
+
+
+def test_readme_examples():
+    c = make_corrector()
+    assert c.correct("Thanks for calling CSI Inter fusion.") == "Thanks for calling CSI Interfusion."
+    assert c.correct("Is Omni Connect down?") == "Is OmniConnect down?"
+    assert c.correct("omni-connect and csi interfusion’s portal") == "OmniConnect and CSI Interfusion’s portal"
+
+
+def test_word_boundaries():
+    c = make_corrector()
+    assert c.correct("csi interfusions") == "csi interfusions"
+    assert c.correct("Omni Connections") == "Omni Connections"
+    assert c.correct("xomni connect") == "xomni connect"
+
+
+def test_leftmost_longest():
+    c = TermCorrector(["Integration Platform", "Enterprise Integration", "Enterprise Integration Platform"])
+    text = "the enterprise integration platform"
+    assert c.find(text) == [(4, len(text), "Enterprise Integration Platform")]
+    assert c.correct(text) == "the Enterprise Integration Platform"
+
+
+def test_add_term_after_lookup():
+    c = TermCorrector(["OmniConnect"])
+    assert c.correct("csi inter fusion") == "csi inter fusion"
+    assert c.add_term("CSI Interfusion")
+    assert not c.add_term("csi interfusion")
+    assert c.correct("csi inter fusion") == "CSI Interfusion"
+    assert len(c) == 2
+
+
+def test_lookup_does_not_wait_on_writers():
+    c = make_corrector()
+    with c._lock:  # a relink in progress elsewhere
+        assert c.correct("omni connect") == "OmniConnect"
+
+
+def test_punctuation_is_a_hard_break():
+    c = TermCorrector(["Secure gateway", "Enterprise Platform"])
+    assert c.correct("He was secure. Gateway closed.") == "He was secure. Gateway closed."
+    assert c.correct("I was in the enterprise. Platform nine.") == "I was in the enterprise. Platform nine."
+    assert c.correct("The secure gate way is up.") == "The Secure gateway is up."
+
+
+def test_terms_with_hard_break_punctuation_are_rejected():
+    c = make_corrector()
+    assert not c.add_term("Node.js")
+    assert not c.add_term("24/7 hotline")
+    assert c.add_term("Omni-Connect Pro")
+    assert c.correct("node js and omniconnect pro") == "node js and Omni-Connect Pro"
+
+
+def test_itn_text_with_daemon_terms():
+    # phrase-list spans + the shipped corpus, as custom_stt_daemon loads them
+    c = TermCorrector(extract_terms(["Thank you for calling CSI Interfusion", "OmniConnect setup"]))
+    c.add_terms(mine_terms([CORPUS_DIR / "CSI_Interfusion_STT_training_dataset_150.txt"]))
+
+    assert c.correct("thank you for calling csi interfusion") == "thank you for calling CSI Interfusion"
+    assert c.correct("i need help with the enterprise integration platform") == (
+        "i need help with the Enterprise Integration Platform"
+    )
+    assert c.correct("polyglot gateway is down") == "Polyglot Gateway is down"
+    assert c.correct("hyper converged data engine") == "HyperConverged Data Engine"
+
+
+def test_unicode_offsets():
+    c = make_corrector()
+    assert c.correct("İ omni connect") == "İ OmniConnect"
+    assert c.correct("İzmir and omni connect") == "İzmir and OmniConnect"
+
+
+def test_mine_terms(tmp_path):
+    corpus = tmp_path / "trans.txt"
+    corpus.write_text(
+        "001_.wav\tCould you explain CSI Interfusion’s OmniConnect service?\n"
+        "002_.wav\tPlease assist me with the Enterprise Integration Platform.\n",
+        encoding="utf-8",
+    )
+    assert mine_terms([corpus, tmp_path / "missing.txt"]) == [
+        "CSI Interfusion",
+        "OmniConnect",
+        "Enterprise Integration Platform",
+    ]
+
+
+def test_extract_terms_skips_sentence_starts():
+    assert extract_terms(["Secure gateway", "Send me documentation for CSI Interfusion’s AI module"]) == [
+        "CSI Interfusion",
+    ]
+
+
+def test_add_domain_terms_reaches_correct_text(tmp_path, monkeypatch):
+    monkeypatch.setattr(term_corrector, "_shared", None)
+    assert add_domain_terms(["Polyglot Gateway"]) == 0
+    assert correct_text("omni connect") == "omni connect"
+
+    corpus = tmp_path / "trans.txt"
+    corpus.write_text("001_.wav\tPlease verify the OmniConnect service.\n", encoding="utf-8")
+    shared = load_shared_corrector(["Thank you for calling CSI Interfusion"], [corpus])
+    assert load_shared_corrector([], []) is shared
+    assert correct_text("csi inter fusion omni connect") == "CSI Interfusion OmniConnect"
+
+    assert correct_text("the poly glot gateway") == "the poly glot gateway"
+    assert add_domain_terms(["Polyglot Gateway", "OmniConnect"]) == 1
+    assert correct_text("the poly glot gateway") == "the Polyglot Gateway"